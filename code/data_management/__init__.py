@@ -4,16 +4,24 @@ Data Management & Versioning
 Comprehensive system for tracking data, experiments, and artifacts.
 """
 
-from .dvc_manager import DVCManager
-from .mlflow_manager import MLflowManager
-from .artifact_manager import ArtifactManager
-from .git_workflows import GitWorkflowManager
-from .auto_tracking import AutoTracker
+from importlib import import_module
 
-__all__ = [
-    "DVCManager",
-    "MLflowManager",
-    "ArtifactManager",
-    "GitWorkflowManager",
-    "AutoTracker",
-]
+# Exports are imported on first access so that using one manager does not
+# pull in the dependencies of the others (e.g. mlflow).
+_EXPORTS = {
+    "DVCManager": ".dvc_manager",
+    "MLflowManager": ".mlflow_manager",
+    "ArtifactManager": ".artifact_manager",
+    "GitWorkflowManager": ".git_workflows",
+    "AutoTracker": ".auto_tracking",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
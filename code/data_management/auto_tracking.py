@@ -233,12 +233,19 @@ def create_auto_tracker(
     Returns:
         AutoTracker instance
     """
-    from .dvc_manager import DVCManager
-    from .mlflow_manager import MLflowManager
-    from .git_workflows import GitWorkflowManager
+    # Import managers only when enabled; mlflow in particular is slow to import
+    dvc = mlflow = git = None
 
-    dvc = DVCManager(project_root) if enable_dvc else None
-    mlflow = MLflowManager() if enable_mlflow else None
-    git = GitWorkflowManager(project_root) if enable_git else None
+    if enable_dvc:
+        from .dvc_manager import DVCManager
+        dvc = DVCManager(project_root)
+
+    if enable_mlflow:
+        from .mlflow_manager import MLflowManager
+        mlflow = MLflowManager()
+
+    if enable_git:
+        from .git_workflows import GitWorkflowManager
+        git = GitWorkflowManager(project_root)
 
     return AutoTracker(project_root, dvc, mlflow, git)
@@ -12,7 +12,7 @@ import sys
 
 sys.path.insert(0, str(Path(__file__).parent))
 
-from workflow_context import WorkflowContext, ResearchPhase, Mode, ValidationResult
+from workflow_context import WorkflowContext, ResearchPhase, Mode, ValidationResult, PHASE_COUNT
 from research_workflow import ResearchWorkflow
 from validators import FINERValidator, PRISMAValidator, NIHRigorValidator
 
@@ -53,6 +53,22 @@ class WorkflowOrchestrator:
         ResearchPhase.PUBLICATION: "quality-assurance"
     }
 
+    # Map phases to their expected outputs (placeholder paths)
+    PHASE_OUTPUTS = {
+        ResearchPhase.PROBLEM_FORMULATION: ("docs/problem_statement.md",),
+        ResearchPhase.LITERATURE_REVIEW: (
+            "data/literature/search_results.csv",
+            "data/literature/included_studies.csv"
+        ),
+        ResearchPhase.GAP_ANALYSIS: ("docs/gap_analysis.md",),
+        ResearchPhase.HYPOTHESIS_FORMATION: ("docs/hypotheses.md",),
+        ResearchPhase.EXPERIMENTAL_DESIGN: (
+            "docs/experimental_protocol.md",
+            "docs/power_analysis.md",
+            "code/randomization.py"
+        ),
+    }
+
     def __init__(self, workflow: ResearchWorkflow):
         """
         Initialize orchestrator with workflow.
@@ -236,22 +252,10 @@ class WorkflowOrchestrator:
         In real implementation, would scan project directories.
         For now, returns placeholder based on phase.
         """
-        output_map = {
-            ResearchPhase.PROBLEM_FORMULATION: ["docs/problem_statement.md"],
-            ResearchPhase.LITERATURE_REVIEW: [
-                "data/literature/search_results.csv",
-                "data/literature/included_studies.csv"
-            ],
-            ResearchPhase.GAP_ANALYSIS: ["docs/gap_analysis.md"],
-            ResearchPhase.HYPOTHESIS_FORMATION: ["docs/hypotheses.md"],
-            ResearchPhase.EXPERIMENTAL_DESIGN: [
-                "docs/experimental_protocol.md",
-                "docs/power_analysis.md",
-                "code/randomization.py"
-            ],
-        }
-
-        return output_map.get(phase, [f"output_{phase.value}.md"])
+        outputs = self.PHASE_OUTPUTS.get(phase)
+        if outputs is None:
+            return [f"output_{phase.value}.md"]
+        return list(outputs)
 
     def get_workflow_status(self) -> Dict:
         """Get current workflow status"""
@@ -266,11 +270,8 @@ class WorkflowOrchestrator:
             "current_agent": agent,
             "can_advance": can_advance,
             "progress_percentage": self.workflow.get_progress_percentage(),
-            "completed_phases": sum(
-                1 for phase in ResearchPhase
-                if self.context.has_completed_phase(phase)
-            ),
-            "total_phases": len(list(ResearchPhase))
+            "completed_phases": self.context.completed_phase_count(),
+            "total_phases": PHASE_COUNT
         }
 
 
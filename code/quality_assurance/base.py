@@ -4,15 +4,22 @@ Base Validation Framework
 Core classes and utilities for quality assurance validation.
 """
 
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from functools import cached_property
+from typing import List, Optional, Dict, Any, Iterator
 from pathlib import Path
 from enum import Enum
 import logging
+import os
+import re
 
 logger = logging.getLogger(__name__)
 
+# Recursive suffix globs ("**/*.py", "docs/**/*.md") served from the file index
+RECURSIVE_SUFFIX_GLOB = re.compile(r"^(?:(?P<prefix>[^*?\[\]]+)/)?\*\*/\*(?P<suffix>\.\w+)$")
+
 
 class ValidationStatus(Enum):
     """Validation check status."""
@@ -120,18 +127,16 @@ class QAReport:
         """Get results filtered by category."""
         return [r for r in self.results if r.category == category]
 
-    def to_markdown(self) -> str:
-        """Export report as markdown."""
-        lines = [
-            f"# QA Report: {self.project}",
-            f"",
-            f"**Generated:** {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}",
-        ]
+    def iter_markdown(self) -> Iterator[str]:
+        """Yield the markdown report line by line (without newlines)."""
+        yield f"# QA Report: {self.project}"
+        yield f""
+        yield f"**Generated:** {self.timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
 
         if self.phase:
-            lines.append(f"**Phase:** {self.phase}")
+            yield f"**Phase:** {self.phase}"
 
-        lines.extend([
+        yield from [
             f"**Status:** {self.status.value.upper()}",
             f"",
             f"## Summary",
@@ -142,7 +147,7 @@ class QAReport:
             f"- Errors: {self.errors} ❌",
             f"- Skipped: {self.skipped}",
             f"",
-        ])
+        ]
 
         # Group by category
         categories = set(r.category for r in self.results)
@@ -150,10 +155,8 @@ class QAReport:
         for category in sorted(categories):
             results = self.get_by_category(category)
 
-            lines.extend([
-                f"## {category.title()} ({len(results)} checks)",
-                f"",
-            ])
+            yield f"## {category.title()} ({len(results)} checks)"
+            yield f""
 
             for result in results:
                 status_emoji = {
@@ -163,20 +166,22 @@ class QAReport:
                     ValidationStatus.SKIPPED: "⏭️",
                 }[result.status]
 
-                lines.append(f"### {status_emoji} {result.check_name}")
-                lines.append(f"")
-                lines.append(f"**Status:** {result.status.value}")
-                lines.append(f"**Message:** {result.message}")
+                yield f"### {status_emoji} {result.check_name}"
+                yield f""
+                yield f"**Status:** {result.status.value}"
+                yield f"**Message:** {result.message}"
 
                 if result.details:
-                    lines.append(f"")
-                    lines.append(f"**Details:**")
+                    yield f""
+                    yield f"**Details:**"
                     for key, value in result.details.items():
-                        lines.append(f"- {key}: {value}")
+                        yield f"- {key}: {value}"
 
-                lines.append(f"")
+                yield f""
 
-        return "\n".join(lines)
+    def to_markdown(self) -> str:
+        """Export report as markdown."""
+        return "\n".join(self.iter_markdown())
 
     def to_dict(self) -> Dict[str, Any]:
         """Export report as dictionary."""
@@ -197,7 +202,11 @@ class QAReport:
 
     def save_markdown(self, output_path: Path):
         """Save report as markdown file."""
-        output_path.write_text(self.to_markdown())
+        with output_path.open("w") as f:
+            for i, line in enumerate(self.iter_markdown()):
+                if i:
+                    f.write("\n")
+                f.write(line)
         logger.info(f"QA report saved to {output_path}")
 
     def save_json(self, output_path: Path):
@@ -271,8 +280,9 @@ class BaseValidator:
         self.add_result(check_name, ValidationStatus.SKIPPED, message, **kwargs)
 
     def clear_results(self):
-        """Clear all validation results."""
+        """Clear all validation results and the cached file index."""
         self.results = []
+        self.__dict__.pop("source_files", None)
 
     def get_results(self) -> List[ValidationResult]:
         """Get all validation results."""
@@ -318,11 +328,10 @@ class BaseValidator:
         if relative:
             filepath = self.project_root / filepath
 
-        if not filepath.exists():
-            return None
-
         try:
             return filepath.read_text()
+        except FileNotFoundError:
+            return None
         except Exception as e:
             logger.error(f"Error reading {filepath}: {e}")
             return None
@@ -337,7 +346,30 @@ class BaseValidator:
         Returns:
             List of matching file paths
         """
-        return list(self.project_root.glob(pattern))
+        match = RECURSIVE_SUFFIX_GLOB.match(pattern)
+        if not match:
+            return list(self.project_root.glob(pattern))
+
+        files = self.source_files.get(match.group("suffix"), [])
+        prefix = match.group("prefix")
+        if prefix:
+            base = self.project_root / prefix
+            files = [f for f in files if f.is_relative_to(base)]
+        return list(files)
+
+    @cached_property
+    def source_files(self) -> Dict[str, List[Path]]:
+        """
+        Project files grouped by suffix, built from a single directory walk.
+
+        Cached until clear_results() is called.
+        """
+        index = defaultdict(list)
+        for dirpath, _, filenames in os.walk(self.project_root):
+            for name in filenames:
+                path = Path(dirpath) / name
+                index[path.suffix].append(path)
+        return dict(index)
 
 
 class QAException(Exception):
@@ -2,13 +2,22 @@
 Citation Verification System
 
 Validates citations for accuracy, retraction status, and completeness.
+
+DOI and retraction checks are network-bound (one Crossref round trip per
+DOI), so uncached DOIs are fetched concurrently on a small thread pool that
+shares a single request-rate limit.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
 from pathlib import Path
-from typing import List, Optional, Dict, Set, Tuple
+from typing import List, Optional, Dict, Set, Tuple, Iterable
 import re
-import requests
+import sqlite3
+import threading
 import time
+import requests
+from requests.adapters import HTTPAdapter
 import logging
 from datetime import datetime, timedelta
 
@@ -16,6 +25,35 @@ from .base import BaseValidator, ValidationResult, ValidationStatus
 
 logger = logging.getLogger(__name__)
 
+# Simple BibTeX parser patterns
+# Pattern: @type{key, field = {value}, ...}
+BIBTEX_ENTRY_PATTERN = re.compile(
+    r'@(\w+)\{([^,]+),\s*(.*?)\n\}',
+    re.DOTALL | re.IGNORECASE
+)
+BIBTEX_FIELD_PATTERN = re.compile(r'(\w+)\s*=\s*\{([^}]*)\}')
+
+# Crossref statuses that mean "try again later" rather than "no such DOI"
+CROSSREF_RETRY_STATUSES = {429}
+
+
+class _RateLimiter:
+    """Space calls at least 1/rate seconds apart across all threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self):
+        """Block until the next call slot is due."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at)
+            self._next_at = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
 
 class CitationVerifier(BaseValidator):
     """
@@ -41,6 +79,13 @@ class CitationVerifier(BaseValidator):
                 - require_recent_papers: Require recent literature
                 - recent_paper_threshold_years: Years threshold for "recent"
                 - crossref_email: Email for Crossref API (polite pool)
+                - crossref_max_workers: Concurrent Crossref requests
+                  (default: 5 with crossref_email, otherwise 1)
+                - crossref_rate_limit: Max Crossref requests per second (default: 20)
+                - persist_doi_cache: Keep DOI validity in .qa_cache/ across runs
+                  (default: False; only saves requests when check_retractions
+                  is off, since retraction checks always fetch fresh metadata)
+                - doi_cache_ttl_days: Days before a persisted lookup is refetched
         """
         super().__init__(project_root, config)
 
@@ -51,10 +96,32 @@ class CitationVerifier(BaseValidator):
         self.require_recent_papers = cfg.get("require_recent_papers", True)
         self.recent_threshold_years = cfg.get("recent_paper_threshold_years", 5)
         self.crossref_email = cfg.get("crossref_email", None)
+        self.crossref_max_workers = cfg.get("crossref_max_workers") or (
+            5 if self.crossref_email else 1
+        )
+        self.crossref_limiter = _RateLimiter(cfg.get("crossref_rate_limit", 20))
+        self.persist_doi_cache = cfg.get("persist_doi_cache", False)
+        self.doi_cache_ttl_days = cfg.get("doi_cache_ttl_days", 30)
+        self.doi_cache_path = self.project_root / ".qa_cache" / "doi_cache.db"
 
         # Cache for API results (DOI -> result)
         self.doi_cache: Dict[str, Dict] = {}
         self.retraction_cache: Dict[str, bool] = {}
+        self._persisted_cache_loaded = False
+
+        # Shared HTTP session so concurrent lookups reuse pooled connections
+        self.session = requests.Session()
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=max(1, self.crossref_max_workers)
+            )
+        )
+        if self.crossref_email:
+            self.session.headers["User-Agent"] = (
+                f"ResearchAssistant/1.0 (mailto:{self.crossref_email})"
+            )
 
     def validate(self) -> List[ValidationResult]:
         """
@@ -94,11 +161,14 @@ class CitationVerifier(BaseValidator):
         self.validate_bibtex_format(all_entries)
         self.validate_citation_count(all_entries)
 
+        # Both Crossref checks work from the same (key, DOI) pairs
+        dois = self._extract_dois(all_entries)
+
         if self.validate_dois:
-            self.validate_dois_batch(all_entries)
+            self.validate_dois_batch(all_entries, dois=dois)
 
         if self.check_retractions:
-            self.check_retractions_batch(all_entries)
+            self.check_retractions_batch(all_entries, dois=dois)
 
         if self.require_recent_papers:
             self.validate_recent_literature(all_entries)
@@ -124,27 +194,19 @@ class CitationVerifier(BaseValidator):
             return []
 
         entries = []
+        rel_file = str(bib_file.relative_to(self.project_root))
 
-        # Simple BibTeX parser
-        # Pattern: @type{key, field = {value}, ...}
-        entry_pattern = re.compile(
-            r'@(\w+)\{([^,]+),\s*(.*?)\n\}',
-            re.DOTALL | re.IGNORECASE
-        )
-
-        for match in entry_pattern.finditer(content):
+        for match in BIBTEX_ENTRY_PATTERN.finditer(content):
             entry_type, key, fields_str = match.groups()
 
             entry = {
                 "type": entry_type.lower(),
                 "key": key.strip(),
-                "file": str(bib_file.relative_to(self.project_root))
+                "file": rel_file
             }
 
             # Parse fields
-            field_pattern = re.compile(r'(\w+)\s*=\s*\{([^}]*)\}')
-            for field_match in field_pattern.finditer(fields_str):
-                field_name, field_value = field_match.groups()
+            for field_name, field_value in BIBTEX_FIELD_PATTERN.findall(fields_str):
                 entry[field_name.lower()] = field_value.strip()
 
             entries.append(entry)
@@ -237,19 +299,23 @@ class CitationVerifier(BaseValidator):
     # DOI Validation
     # ============================================================================
 
-    def validate_dois_batch(self, entries: List[Dict]):
-        """Validate DOIs using Crossref API."""
+    def validate_dois_batch(
+        self,
+        entries: List[Dict],
+        dois: Optional[List[Tuple[str, str]]] = None
+    ):
+        """
+        Validate DOIs using Crossref API.
+
+        Args:
+            entries: Parsed BibTeX entries
+            dois: Precomputed (key, DOI) pairs from _extract_dois (optional)
+        """
         check_name = "DOI Validation"
         category = "citation"
 
-        # Extract DOIs
-        dois = []
-        for entry in entries:
-            doi = entry.get("doi", "").strip()
-            if doi:
-                # Clean DOI (remove URL prefix if present)
-                doi = doi.replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
-                dois.append((entry["key"], doi))
+        if dois is None:
+            dois = self._extract_dois(entries)
 
         if not dois:
             self.skip_check(
@@ -259,41 +325,23 @@ class CitationVerifier(BaseValidator):
             )
             return
 
-        # Validate DOIs
+        # Fetch uncached DOIs concurrently
+        self._prefetch_dois(doi for _, doi in dois)
+
         valid_dois = []
         invalid_dois = []
+        unchecked_dois = []
 
         for key, doi in dois:
-            # Check cache first
-            if doi in self.doi_cache:
-                if self.doi_cache[doi].get("valid", False):
-                    valid_dois.append(doi)
-                else:
-                    invalid_dois.append((key, doi))
-                continue
-
-            # Query Crossref
-            is_valid, metadata = self.check_doi_crossref(doi)
-
-            # Cache result
-            self.doi_cache[doi] = {"valid": is_valid, "metadata": metadata}
-
-            if is_valid:
+            # Failed lookups are not cached
+            if doi not in self.doi_cache:
+                unchecked_dois.append((key, doi))
+            elif self.doi_cache[doi].get("valid", False):
                 valid_dois.append(doi)
             else:
                 invalid_dois.append((key, doi))
 
-            # Rate limiting
-            time.sleep(0.05)  # 20 requests/second
-
-        if not invalid_dois:
-            self.pass_check(
-                check_name,
-                f"All {len(valid_dois)} DOIs are valid",
-                category=category,
-                details={"valid_count": len(valid_dois)}
-            )
-        else:
+        if invalid_dois:
             self.warn_check(
                 check_name,
                 f"{len(invalid_dois)} invalid DOIs found",
@@ -301,11 +349,136 @@ class CitationVerifier(BaseValidator):
                 details={
                     "valid_count": len(valid_dois),
                     "invalid_count": len(invalid_dois),
+                    "unchecked_count": len(unchecked_dois),
                     "invalid_examples": [f"{k}: {d}" for k, d in invalid_dois[:5]]
                 }
             )
+        elif unchecked_dois:
+            self.warn_check(
+                check_name,
+                f"{len(unchecked_dois)} DOIs could not be checked (Crossref lookup failed)",
+                category=category,
+                details={
+                    "valid_count": len(valid_dois),
+                    "unchecked_count": len(unchecked_dois),
+                    "unchecked_examples": [f"{k}: {d}" for k, d in unchecked_dois[:5]]
+                }
+            )
+        else:
+            self.pass_check(
+                check_name,
+                f"All {len(valid_dois)} DOIs are valid",
+                category=category,
+                details={"valid_count": len(valid_dois)}
+            )
+
+    def _extract_dois(self, entries: List[Dict]) -> List[Tuple[str, str]]:
+        """Extract (key, DOI) pairs, stripping any doi.org URL prefix."""
+        dois = []
+        for entry in entries:
+            doi = entry.get("doi", "").strip()
+            if doi:
+                # Clean DOI (remove URL prefix if present)
+                doi = doi.replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
+                dois.append((entry["key"], doi))
+        return dois
+
+    def _prefetch_dois(self, dois: Iterable[str], need_metadata: bool = False):
+        """
+        Populate doi_cache for uncached DOIs using concurrent Crossref requests.
+
+        Args:
+            dois: DOIs to look up (duplicates and cached DOIs are skipped)
+            need_metadata: Also refetch DOIs whose validity came from the
+                persisted cache, which stores no metadata
+        """
+        if need_metadata:
+            pending = [
+                doi for doi in dict.fromkeys(dois) if not self._has_metadata(doi)
+            ]
+        else:
+            pending = [doi for doi in dict.fromkeys(dois) if doi not in self.doi_cache]
+            if pending and self.persist_doi_cache:
+                self._load_persisted_cache()
+                pending = [doi for doi in pending if doi not in self.doi_cache]
+        if not pending:
+            return
+
+        fetched = {}
+        max_workers = max(1, min(self.crossref_max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for doi, (is_valid, metadata) in zip(
+                pending, executor.map(self.check_doi_crossref, pending)
+            ):
+                # Leave failed lookups uncached so they read as unchecked
+                if is_valid is not None:
+                    fetched[doi] = {"valid": is_valid, "metadata": metadata}
+
+        self.doi_cache.update(fetched)
+        if self.persist_doi_cache:
+            self._persist_cache(fetched)
+
+    def _has_metadata(self, doi: str) -> bool:
+        """Check doi_cache holds a lookup made this run (not a persisted one)."""
+        cached = self.doi_cache.get(doi)
+        return cached is not None and (
+            cached["metadata"] is not None or not cached["valid"]
+        )
+
+    # ============================================================================
+    # Persistent DOI Cache
+    # ============================================================================
+
+    def _load_persisted_cache(self):
+        """Load unexpired DOI validity from disk into doi_cache (once)."""
+        if self._persisted_cache_loaded:
+            return
+        self._persisted_cache_loaded = True
+
+        if not self.doi_cache_path.exists():
+            return
+
+        cutoff = int(time.time()) - self.doi_cache_ttl_days * 86400
+        try:
+            with closing(sqlite3.connect(self.doi_cache_path)) as conn:
+                rows = conn.execute(
+                    "SELECT doi FROM doi_validity WHERE fetched_at >= ?",
+                    (cutoff,)
+                ).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading DOI cache {self.doi_cache_path}: {e}")
+            return
+
+        for (doi,) in rows:
+            self.doi_cache.setdefault(doi, {"valid": True, "metadata": None})
 
-    def check_doi_crossref(self, doi: str) -> Tuple[bool, Optional[Dict]]:
+    def _persist_cache(self, results: Dict[str, Dict]):
+        """
+        Write valid DOIs to disk.
+
+        Only validity is persisted. Metadata is left out so that retraction
+        status is never read from a stale lookup, and invalid DOIs are
+        rechecked on every run.
+        """
+        now = int(time.time())
+        rows = [(doi, now) for doi, result in results.items() if result["valid"]]
+        if not rows:
+            return
+
+        try:
+            self.doi_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with closing(sqlite3.connect(self.doi_cache_path)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS doi_validity ("
+                    "doi TEXT PRIMARY KEY, fetched_at INTEGER)"
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO doi_validity VALUES (?, ?)", rows
+                )
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Error writing DOI cache {self.doi_cache_path}: {e}")
+
+    def check_doi_crossref(self, doi: str) -> Tuple[Optional[bool], Optional[Dict]]:
         """
         Check DOI validity using Crossref API.
 
@@ -313,44 +486,53 @@ class CitationVerifier(BaseValidator):
             doi: DOI to check
 
         Returns:
-            (is_valid, metadata) tuple
+            (is_valid, metadata) tuple. is_valid is None when the lookup
+            failed (rate limited, server or network error) rather than
+            showing the DOI is invalid.
         """
         try:
             url = f"https://api.crossref.org/works/{doi}"
-            headers = {}
-
-            if self.crossref_email:
-                headers["User-Agent"] = f"ResearchAssistant/1.0 (mailto:{self.crossref_email})"
-
-            response = requests.get(url, headers=headers, timeout=10)
+            self.crossref_limiter.wait()
+            response = self.session.get(url, timeout=10)
 
             if response.status_code == 200:
                 data = response.json()
                 metadata = data.get("message", {})
                 return True, metadata
+            elif (
+                response.status_code in CROSSREF_RETRY_STATUSES
+                or response.status_code >= 500
+            ):
+                logger.error(f"Crossref returned {response.status_code} for DOI {doi}")
+                return None, None
             else:
                 return False, None
 
         except Exception as e:
             logger.error(f"Error checking DOI {doi}: {e}")
-            return False, None
+            return None, None
 
     # ============================================================================
     # Retraction Checking
     # ============================================================================
 
-    def check_retractions_batch(self, entries: List[Dict]):
-        """Check for retracted papers using Crossref."""
+    def check_retractions_batch(
+        self,
+        entries: List[Dict],
+        dois: Optional[List[Tuple[str, str]]] = None
+    ):
+        """
+        Check for retracted papers using Crossref.
+
+        Args:
+            entries: Parsed BibTeX entries
+            dois: Precomputed (key, DOI) pairs from _extract_dois (optional)
+        """
         check_name = "Retraction Check"
         category = "citation"
 
-        # Extract DOIs
-        dois = []
-        for entry in entries:
-            doi = entry.get("doi", "").strip()
-            if doi:
-                doi = doi.replace("https://doi.org/", "").replace("http://dx.doi.org/", "")
-                dois.append((entry["key"], doi))
+        if dois is None:
+            dois = self._extract_dois(entries)
 
         if not dois:
             self.skip_check(
@@ -360,7 +542,14 @@ class CitationVerifier(BaseValidator):
             )
             return
 
+        # Fetch fresh metadata for DOIs not yet checked concurrently
+        self._prefetch_dois(
+            (doi for _, doi in dois if doi not in self.retraction_cache),
+            need_metadata=True
+        )
+
         retracted = []
+        unchecked = []
 
         for key, doi in dois:
             # Check cache
@@ -369,6 +558,11 @@ class CitationVerifier(BaseValidator):
                     retracted.append((key, doi))
                 continue
 
+            # Crossref lookup failed, status unknown
+            if not self._has_metadata(doi):
+                unchecked.append((key, doi))
+                continue
+
             # Check Crossref for retraction status
             is_retracted = self.check_retraction_crossref(doi)
             self.retraction_cache[doi] = is_retracted
@@ -376,26 +570,35 @@ class CitationVerifier(BaseValidator):
             if is_retracted:
                 retracted.append((key, doi))
 
-            # Rate limiting
-            time.sleep(0.05)
-
-        if not retracted:
-            self.pass_check(
-                check_name,
-                f"No retractions found in {len(dois)} citations with DOIs",
-                category=category,
-                details={"checked_count": len(dois)}
-            )
-        else:
+        if retracted:
             self.error_check(
                 check_name,
                 f"{len(retracted)} retracted paper(s) found",
                 category=category,
                 details={
                     "retracted_count": len(retracted),
+                    "unchecked_count": len(unchecked),
                     "retracted": [f"{k}: {d}" for k, d in retracted]
                 }
             )
+        elif unchecked:
+            self.warn_check(
+                check_name,
+                f"Retraction status unknown for {len(unchecked)} DOIs (Crossref lookup failed)",
+                category=category,
+                details={
+                    "checked_count": len(dois) - len(unchecked),
+                    "unchecked_count": len(unchecked),
+                    "unchecked_examples": [f"{k}: {d}" for k, d in unchecked[:5]]
+                }
+            )
+        else:
+            self.pass_check(
+                check_name,
+                f"No retractions found in {len(dois)} citations with DOIs",
+                category=category,
+                details={"checked_count": len(dois)}
+            )
 
     def check_retraction_crossref(self, doi: str) -> bool:
         """
@@ -408,9 +611,9 @@ class CitationVerifier(BaseValidator):
             True if retracted
         """
         try:
-            # First check if we have metadata cached
-            if doi in self.doi_cache:
-                metadata = self.doi_cache[doi].get("metadata", {})
+            # First check if we have metadata from this run cached
+            if self._has_metadata(doi):
+                metadata = self.doi_cache[doi]["metadata"] or {}
             else:
                 # Fetch metadata
                 is_valid, metadata = self.check_doi_crossref(doi)
@@ -446,27 +649,19 @@ class CitationVerifier(BaseValidator):
         current_year = datetime.now().year
         threshold_year = current_year - self.recent_threshold_years
 
-        recent_papers = []
-        old_papers = []
-        no_year = []
+        recent_count = 0
+        total = 0
 
         for entry in entries:
-            year_str = entry.get("year", "").strip()
-
-            if not year_str:
-                no_year.append(entry["key"])
-                continue
-
             try:
-                year = int(year_str)
-                if year >= threshold_year:
-                    recent_papers.append((entry["key"], year))
-                else:
-                    old_papers.append((entry["key"], year))
+                year = int(entry.get("year", ""))
             except ValueError:
-                no_year.append(entry["key"])
+                continue
+
+            total += 1
+            if year >= threshold_year:
+                recent_count += 1
 
-        total = len(recent_papers) + len(old_papers)
         if total == 0:
             self.skip_check(
                 check_name,
@@ -475,15 +670,15 @@ class CitationVerifier(BaseValidator):
             )
             return
 
-        recent_percentage = (len(recent_papers) / total) * 100
+        recent_percentage = (recent_count / total) * 100
 
         if recent_percentage >= 30:  # At least 30% recent
             self.pass_check(
                 check_name,
-                f"{len(recent_papers)} recent papers ({recent_percentage:.1f}%) from last {self.recent_threshold_years} years",
+                f"{recent_count} recent papers ({recent_percentage:.1f}%) from last {self.recent_threshold_years} years",
                 category=category,
                 details={
-                    "recent_count": len(recent_papers),
+                    "recent_count": recent_count,
                     "total_count": total,
                     "percentage": f"{recent_percentage:.1f}%",
                     "threshold_year": threshold_year
@@ -492,10 +687,10 @@ class CitationVerifier(BaseValidator):
         else:
             self.warn_check(
                 check_name,
-                f"Only {len(recent_papers)} recent papers ({recent_percentage:.1f}%) from last {self.recent_threshold_years} years",
+                f"Only {recent_count} recent papers ({recent_percentage:.1f}%) from last {self.recent_threshold_years} years",
                 category=category,
                 details={
-                    "recent_count": len(recent_papers),
+                    "recent_count": recent_count,
                     "total_count": total,
                     "percentage": f"{recent_percentage:.1f}%",
                     "threshold_year": threshold_year,
@@ -4,13 +4,16 @@ QA Manager
 Orchestrates all quality assurance components and generates comprehensive reports.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, NamedTuple
 from datetime import datetime
 import yaml
 import logging
 
-from .base import QAReport, ValidationResult, ValidationStatus, CriticalQAError
+from .base import (
+    BaseValidator, QAReport, ValidationResult, ValidationStatus, CriticalQAError
+)
 from .reproducibility_validator import ReproducibilityValidator
 from .citation_verifier import CitationVerifier
 from .statistical_validator import StatisticalValidator
@@ -18,6 +21,16 @@ from .statistical_validator import StatisticalValidator
 logger = logging.getLogger(__name__)
 
 
+class _QAStep(NamedTuple):
+    """One validator run by run_full_qa, with its log and crash-report labels."""
+    label: str
+    activity: str
+    validator: BaseValidator
+    check_name: str
+    kind: str
+    category: str
+
+
 class QAManager:
     """
     Central manager for all quality assurance components.
@@ -108,58 +121,58 @@ class QAManager:
         """
         logger.info(f"Running full QA suite{f' for phase: {phase}' if phase else ''}")
 
-        all_results = []
-
-        # Run reproducibility checks
-        logger.info("Running reproducibility validation...")
-        try:
-            repro_results = self.reproducibility.validate()
-            all_results.extend(repro_results)
-            logger.info(f"Reproducibility: {len(repro_results)} checks completed")
-        except Exception as e:
-            logger.error(f"Reproducibility validation error: {e}")
-            all_results.append(
-                ValidationResult(
-                    check_name="Reproducibility Validator",
-                    status=ValidationStatus.ERROR,
-                    message=f"Validator crashed: {str(e)}",
-                    category="reproducibility"
-                )
-            )
+        # Validators are independent and I/O-bound (filesystem scans, Crossref
+        # lookups), so run them concurrently and collect results in order.
+        steps = [
+            _QAStep(
+                label="Reproducibility",
+                activity="reproducibility validation",
+                validator=self.reproducibility,
+                check_name="Reproducibility Validator",
+                kind="Validator",
+                category="reproducibility",
+            ),
+            _QAStep(
+                label="Citations",
+                activity="citation verification",
+                validator=self.citations,
+                check_name="Citation Verifier",
+                kind="Verifier",
+                category="citation",
+            ),
+            _QAStep(
+                label="Statistics",
+                activity="statistical validation",
+                validator=self.statistics,
+                check_name="Statistical Validator",
+                kind="Validator",
+                category="statistical",
+            ),
+        ]
 
-        # Run citation checks
-        logger.info("Running citation verification...")
-        try:
-            citation_results = self.citations.validate()
-            all_results.extend(citation_results)
-            logger.info(f"Citations: {len(citation_results)} checks completed")
-        except Exception as e:
-            logger.error(f"Citation verification error: {e}")
-            all_results.append(
-                ValidationResult(
-                    check_name="Citation Verifier",
-                    status=ValidationStatus.ERROR,
-                    message=f"Verifier crashed: {str(e)}",
-                    category="citation"
-                )
-            )
+        all_results = []
 
-        # Run statistical checks
-        logger.info("Running statistical validation...")
-        try:
-            stat_results = self.statistics.validate()
-            all_results.extend(stat_results)
-            logger.info(f"Statistics: {len(stat_results)} checks completed")
-        except Exception as e:
-            logger.error(f"Statistical validation error: {e}")
-            all_results.append(
-                ValidationResult(
-                    check_name="Statistical Validator",
-                    status=ValidationStatus.ERROR,
-                    message=f"Validator crashed: {str(e)}",
-                    category="statistical"
-                )
-            )
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = []
+            for step in steps:
+                logger.info(f"Running {step.activity}...")
+                futures.append(executor.submit(step.validator.validate))
+
+            for step, future in zip(steps, futures):
+                try:
+                    results = future.result()
+                    all_results.extend(results)
+                    logger.info(f"{step.label}: {len(results)} checks completed")
+                except Exception as e:
+                    logger.error(f"{step.check_name} error: {e}")
+                    all_results.append(
+                        ValidationResult(
+                            check_name=step.check_name,
+                            status=ValidationStatus.ERROR,
+                            message=f"{step.kind} crashed: {str(e)}",
+                            category=step.category
+                        )
+                    )
 
         # Create report
         report = QAReport(
@@ -388,6 +401,10 @@ def create_default_config(output_path: Path):
             "require_recent_papers": True,
             "recent_paper_threshold_years": 5,
             "crossref_email": None,  # Set your email for Crossref API
+            "crossref_max_workers": None,  # Concurrent requests (5 with email, else 1)
+            "crossref_rate_limit": 20,  # Max Crossref requests per second
+            "persist_doi_cache": False,  # Reuse DOI validity from .qa_cache/
+            "doi_cache_ttl_days": 30,
         },
         "statistics": {
             "require_power_analysis": True,
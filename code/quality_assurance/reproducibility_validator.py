@@ -14,6 +14,28 @@ from .base import BaseValidator, ValidationResult, ValidationStatus
 
 logger = logging.getLogger(__name__)
 
+PYTHON_VERSION_PATTERN = re.compile(r"python[>=<~!]*\s*[0-9.]+", re.IGNORECASE)
+
+# Seed-setting calls for random, numpy, torch and tensorflow
+SEED_USAGE_PATTERN = re.compile(
+    r"random\.seed\(|np\.random\.seed\(|numpy\.random\.seed\(|"
+    r"torch\.manual_seed\(|tf\.random\.set_seed\(|tensorflow\.random\.set_seed\(",
+    re.IGNORECASE
+)
+
+# Documented seed values, e.g. "seed: 42"
+SEED_DOC_PATTERN = re.compile(r"seed[s]?\s*[:=]\s*\d+", re.IGNORECASE)
+
+# Data source indicators
+URL_PATTERN = re.compile(r"https?://[^\s]+")
+DOI_PATTERN = re.compile(r"10\.\d{4,}/[^\s]+")
+
+# Documented checksums
+CHECKSUM_PATTERN = re.compile(
+    r"md5[:=]\s*[a-f0-9]{32}|sha256[:=]\s*[a-f0-9]{64}",
+    re.IGNORECASE
+)
+
 
 class ReproducibilityValidator(BaseValidator):
     """
@@ -89,18 +111,16 @@ class ReproducibilityValidator(BaseValidator):
         pyproject = self.read_file("pyproject.toml")
         readme = self.read_file("README.md")
 
-        python_version_pattern = re.compile(r"python[>=<~!]*\s*[0-9.]+", re.IGNORECASE)
-
         documented = False
         location = None
 
-        if requirements and python_version_pattern.search(requirements):
+        if requirements and PYTHON_VERSION_PATTERN.search(requirements):
             documented = True
             location = "requirements.txt"
-        elif pyproject and python_version_pattern.search(pyproject):
+        elif pyproject and PYTHON_VERSION_PATTERN.search(pyproject):
             documented = True
             location = "pyproject.toml"
-        elif readme and python_version_pattern.search(readme):
+        elif readme and PYTHON_VERSION_PATTERN.search(readme):
             documented = True
             location = "README.md"
 
@@ -234,16 +254,6 @@ class ReproducibilityValidator(BaseValidator):
             )
             return
 
-        # Patterns to detect seed setting
-        seed_patterns = [
-            re.compile(r"random\.seed\(", re.IGNORECASE),
-            re.compile(r"np\.random\.seed\(", re.IGNORECASE),
-            re.compile(r"numpy\.random\.seed\(", re.IGNORECASE),
-            re.compile(r"torch\.manual_seed\(", re.IGNORECASE),
-            re.compile(r"tf\.random\.set_seed\(", re.IGNORECASE),
-            re.compile(r"tensorflow\.random\.set_seed\(", re.IGNORECASE),
-        ]
-
         files_with_seeds: Set[Path] = set()
 
         for py_file in python_files:
@@ -251,10 +261,8 @@ class ReproducibilityValidator(BaseValidator):
             if not content:
                 continue
 
-            for pattern in seed_patterns:
-                if pattern.search(content):
-                    files_with_seeds.add(py_file.relative_to(self.project_root))
-                    break
+            if SEED_USAGE_PATTERN.search(content):
+                files_with_seeds.add(py_file.relative_to(self.project_root))
 
         if files_with_seeds:
             self.pass_check(
@@ -288,18 +296,16 @@ class ReproducibilityValidator(BaseValidator):
         readme = self.read_file("README.md")
         docs_files = self.find_files("docs/**/*.md")
 
-        seed_pattern = re.compile(r"seed[s]?\s*[:=]\s*\d+", re.IGNORECASE)
-
         documented = False
         location = None
 
-        if readme and seed_pattern.search(readme):
+        if readme and SEED_DOC_PATTERN.search(readme):
             documented = True
             location = "README.md"
         else:
             for doc_file in docs_files:
                 content = self.read_file(doc_file, relative=False)
-                if content and seed_pattern.search(content):
+                if content and SEED_DOC_PATTERN.search(content):
                     documented = True
                     location = str(doc_file.relative_to(self.project_root))
                     break
@@ -333,9 +339,6 @@ class ReproducibilityValidator(BaseValidator):
         data_readme = self.read_file("data/README.md")
         docs_files = self.find_files("docs/**/*.md")
 
-        # Patterns for data source indicators
-        url_pattern = re.compile(r"https?://[^\s]+")
-        doi_pattern = re.compile(r"10\.\d{4,}/[^\s]+")
         data_keywords = ["dataset", "data source", "downloaded from", "obtained from"]
 
         documented = False
@@ -348,8 +351,8 @@ class ReproducibilityValidator(BaseValidator):
             if not content:
                 continue
 
-            has_url = url_pattern.search(content)
-            has_doi = doi_pattern.search(content)
+            has_url = URL_PATTERN.search(content)
+            has_doi = DOI_PATTERN.search(content)
             has_keywords = any(kw in content.lower() for kw in data_keywords)
 
             if (has_url or has_doi) and has_keywords:
@@ -362,8 +365,8 @@ class ReproducibilityValidator(BaseValidator):
             if not content:
                 continue
 
-            has_url = url_pattern.search(content)
-            has_doi = doi_pattern.search(content)
+            has_url = URL_PATTERN.search(content)
+            has_doi = DOI_PATTERN.search(content)
             has_keywords = any(kw in content.lower() for kw in data_keywords)
 
             if (has_url or has_doi) and has_keywords:
@@ -397,19 +400,13 @@ class ReproducibilityValidator(BaseValidator):
         readme = self.read_file("README.md")
         data_readme = self.read_file("data/README.md")
 
-        # Patterns for checksums
-        checksum_patterns = [
-            re.compile(r"md5[:=]\s*[a-f0-9]{32}", re.IGNORECASE),
-            re.compile(r"sha256[:=]\s*[a-f0-9]{64}", re.IGNORECASE),
-        ]
-
         has_dvc = len(dvc_files) > 0
         has_checksum_docs = False
 
         for content in [readme, data_readme]:
             if not content:
                 continue
-            if any(pattern.search(content) for pattern in checksum_patterns):
+            if CHECKSUM_PATTERN.search(content):
                 has_checksum_docs = True
                 break
 
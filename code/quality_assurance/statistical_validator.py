@@ -8,13 +8,119 @@ from pathlib import Path
 from typing import List, Optional, Dict, Set
 import re
 import ast
+import json
 import logging
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 from .base import BaseValidator, ValidationResult, ValidationStatus
 
 logger = logging.getLogger(__name__)
 
 
+def _any_pattern(*patterns: str) -> "re.Pattern":
+    """Compile patterns into a single case-insensitive alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+# Patterns for power analysis
+POWER_PATTERN = _any_pattern(
+    r"power[_\s]*analysis",
+    r"statsmodels\.stats\.power",
+    r"from.*power.*import",
+    r"pwr\.",  # R pwr package
+    r"TTestPower|FTestAnovaPower|NormalIndPower",
+    r"sample[_\s]*size[_\s]*calculation",
+)
+
+# Patterns for effect size calculations
+EFFECT_SIZE_PATTERN = _any_pattern(
+    r"cohen[_\s]*d",
+    r"effect[_\s]*size",
+    r"eta[_\s]*squared",
+    r"omega[_\s]*squared",
+    r"partial[_\s]*eta",
+    r"hedges[_\s]*g",
+    r"glass[_\s]*delta",
+    r"cramer[_\s]*v",
+    r"odds[_\s]*ratio",
+    r"risk[_\s]*ratio",
+    r"correlation[_\s]*coefficient",
+)
+
+# P-value calculations
+PVALUE_PATTERN = _any_pattern(
+    r"p[_\s]*value",
+    r"pval",
+    r"\.pvalue",
+    r"ttest|chi2|anova|mannwhitneyu|wilcoxon|kruskal",
+)
+
+# Problematic p-value interpretation
+PROBLEMATIC_PVALUE_PATTERN = _any_pattern(
+    r"marginally\s+significant",
+    r"trending\s+toward",
+    r"approached\s+significance",
+    r"almost\s+significant",
+)
+
+# Confidence interval calculations
+CI_PATTERN = _any_pattern(
+    r"confidence[_\s]*interval",
+    r"\bci\b",
+    r"confint",
+    r"conf_int",
+    r"\.conf_int\(",
+)
+
+# Multiple comparison indicators
+MULTIPLE_TEST_PATTERN = _any_pattern(
+    r"for\s+\w+\s+in.*:\s*ttest",
+    r"for\s+\w+\s+in.*:\s*chi2",
+    r"for\s+\w+\s+in.*:\s*mannwhitneyu",
+    r"multiple.*test",
+    r"pairwise.*comparison",
+)
+
+# Multiple comparison correction methods
+CORRECTION_PATTERN = _any_pattern(
+    r"bonferroni",
+    r"holm",
+    r"benjamini",
+    r"hochberg",
+    r"fdr",
+    r"multipletests",
+    r"p\.adjust",
+)
+
+# Assumption test patterns
+ASSUMPTION_PATTERN = _any_pattern(
+    # Normality tests
+    r"shapiro|normaltest|kstest|anderson",
+    r"qqplot|probplot",
+    # Homogeneity of variance
+    r"levene|bartlett|fligner",
+    # Sphericity
+    r"mauchly",
+    # Independence
+    r"durbin.watson",
+    # General diagnostics
+    r"diagnostic|residual.*plot",
+)
+
+# Parametric tests that require assumptions
+PARAMETRIC_TEST_PATTERN = _any_pattern(
+    r"ttest_ind|ttest_rel",
+    r"anova|f_oneway",
+    r"pearsonr",
+    r"linregress|OLS|regression",
+)
+
+
 class StatisticalValidator(BaseValidator):
     """
     Validates statistical analyses for rigor and completeness.
@@ -112,14 +218,22 @@ class StatisticalValidator(BaseValidator):
 
     def extract_notebook_code(self, nb_file: Path) -> Optional[str]:
         """Extract code from Jupyter notebook."""
-        import json
-
+        # Read raw bytes, mirroring read_file's handling of missing and
+        # unreadable files; notebooks are UTF-8 JSON and can be megabytes of
+        # cell outputs, so skip the intermediate str decode
         try:
-            content = self.read_file(nb_file, relative=False)
-            if not content:
-                return None
+            content = nb_file.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.error(f"Error reading {nb_file}: {e}")
+            return None
+
+        if not content:
+            return None
 
-            notebook = json.loads(content)
+        try:
+            notebook = _json_loads(content)
             cells = notebook.get("cells", [])
 
             code_cells = []
@@ -146,19 +260,9 @@ class StatisticalValidator(BaseValidator):
         check_name = "Power Analysis"
         category = "statistical"
 
-        # Patterns for power analysis
-        power_patterns = [
-            re.compile(r"power[_\s]*analysis", re.IGNORECASE),
-            re.compile(r"statsmodels\.stats\.power", re.IGNORECASE),
-            re.compile(r"from.*power.*import", re.IGNORECASE),
-            re.compile(r"pwr\.", re.IGNORECASE),  # R pwr package
-            re.compile(r"TTestPower|FTestAnovaPower|NormalIndPower", re.IGNORECASE),
-            re.compile(r"sample[_\s]*size[_\s]*calculation", re.IGNORECASE),
-        ]
-
         files_with_power = []
         for filename, content in code_contents:
-            if any(pattern.search(content) for pattern in power_patterns):
+            if POWER_PATTERN.search(content):
                 files_with_power.append(filename)
 
         # Also check documentation
@@ -166,12 +270,12 @@ class StatisticalValidator(BaseValidator):
         readme = self.read_file("README.md")
 
         doc_has_power = False
-        if readme and any(pattern.search(readme) for pattern in power_patterns):
+        if readme and POWER_PATTERN.search(readme):
             doc_has_power = True
 
         for doc_file in docs_files:
             content = self.read_file(doc_file, relative=False)
-            if content and any(pattern.search(content) for pattern in power_patterns):
+            if content and POWER_PATTERN.search(content):
                 doc_has_power = True
                 break
 
@@ -203,24 +307,9 @@ class StatisticalValidator(BaseValidator):
         check_name = "Effect Size Reporting"
         category = "statistical"
 
-        # Patterns for effect size calculations
-        effect_size_patterns = [
-            re.compile(r"cohen[_\s]*d", re.IGNORECASE),
-            re.compile(r"effect[_\s]*size", re.IGNORECASE),
-            re.compile(r"eta[_\s]*squared", re.IGNORECASE),
-            re.compile(r"omega[_\s]*squared", re.IGNORECASE),
-            re.compile(r"partial[_\s]*eta", re.IGNORECASE),
-            re.compile(r"hedges[_\s]*g", re.IGNORECASE),
-            re.compile(r"glass[_\s]*delta", re.IGNORECASE),
-            re.compile(r"cramer[_\s]*v", re.IGNORECASE),
-            re.compile(r"odds[_\s]*ratio", re.IGNORECASE),
-            re.compile(r"risk[_\s]*ratio", re.IGNORECASE),
-            re.compile(r"correlation[_\s]*coefficient", re.IGNORECASE),
-        ]
-
         files_with_effect_sizes = []
         for filename, content in code_contents:
-            if any(pattern.search(content) for pattern in effect_size_patterns):
+            if EFFECT_SIZE_PATTERN.search(content):
                 files_with_effect_sizes.append(filename)
 
         if files_with_effect_sizes:
@@ -249,22 +338,6 @@ class StatisticalValidator(BaseValidator):
         check_name = "P-Value Usage"
         category = "statistical"
 
-        # Check for p-value calculations
-        pvalue_patterns = [
-            re.compile(r"p[_\s]*value", re.IGNORECASE),
-            re.compile(r"pval", re.IGNORECASE),
-            re.compile(r"\.pvalue", re.IGNORECASE),
-            re.compile(r"ttest|chi2|anova|mannwhitneyu|wilcoxon|kruskal", re.IGNORECASE),
-        ]
-
-        # Problematic interpretation patterns
-        problematic_patterns = [
-            re.compile(r"marginally\s+significant", re.IGNORECASE),
-            re.compile(r"trending\s+toward", re.IGNORECASE),
-            re.compile(r"approached\s+significance", re.IGNORECASE),
-            re.compile(r"almost\s+significant", re.IGNORECASE),
-        ]
-
         files_with_pvalues = []
         files_with_problems = []
 
@@ -272,13 +345,13 @@ class StatisticalValidator(BaseValidator):
             # Skip validator files themselves (they contain detection patterns as strings)
             is_validator = "quality_assurance" in filename and filename.endswith("_validator.py")
 
-            has_pvalue = any(pattern.search(content) for pattern in pvalue_patterns)
-            has_problem = any(pattern.search(content) for pattern in problematic_patterns)
+            has_pvalue = PVALUE_PATTERN.search(content)
+            has_problem = not is_validator and PROBLEMATIC_PVALUE_PATTERN.search(content)
 
             if has_pvalue:
                 files_with_pvalues.append(filename)
 
-            if has_problem and not is_validator:
+            if has_problem:
                 files_with_problems.append(filename)
 
         if files_with_problems:
@@ -315,17 +388,9 @@ class StatisticalValidator(BaseValidator):
         check_name = "Confidence Intervals"
         category = "statistical"
 
-        ci_patterns = [
-            re.compile(r"confidence[_\s]*interval", re.IGNORECASE),
-            re.compile(r"\bci\b", re.IGNORECASE),
-            re.compile(r"confint", re.IGNORECASE),
-            re.compile(r"conf_int", re.IGNORECASE),
-            re.compile(r"\.conf_int\(", re.IGNORECASE),
-        ]
-
         files_with_cis = []
         for filename, content in code_contents:
-            if any(pattern.search(content) for pattern in ci_patterns):
+            if CI_PATTERN.search(content):
                 files_with_cis.append(filename)
 
         if files_with_cis:
@@ -354,32 +419,12 @@ class StatisticalValidator(BaseValidator):
         check_name = "Multiple Comparison Corrections"
         category = "statistical"
 
-        # Detect multiple comparisons
-        multiple_test_indicators = [
-            re.compile(r"for\s+\w+\s+in.*:\s*ttest", re.IGNORECASE),
-            re.compile(r"for\s+\w+\s+in.*:\s*chi2", re.IGNORECASE),
-            re.compile(r"for\s+\w+\s+in.*:\s*mannwhitneyu", re.IGNORECASE),
-            re.compile(r"multiple.*test", re.IGNORECASE),
-            re.compile(r"pairwise.*comparison", re.IGNORECASE),
-        ]
-
-        # Correction methods
-        correction_patterns = [
-            re.compile(r"bonferroni", re.IGNORECASE),
-            re.compile(r"holm", re.IGNORECASE),
-            re.compile(r"benjamini", re.IGNORECASE),
-            re.compile(r"hochberg", re.IGNORECASE),
-            re.compile(r"fdr", re.IGNORECASE),
-            re.compile(r"multipletests", re.IGNORECASE),
-            re.compile(r"p\.adjust", re.IGNORECASE),
-        ]
-
         files_with_multiple = []
         files_with_correction = []
 
         for filename, content in code_contents:
-            has_multiple = any(pattern.search(content) for pattern in multiple_test_indicators)
-            has_correction = any(pattern.search(content) for pattern in correction_patterns)
+            has_multiple = MULTIPLE_TEST_PATTERN.search(content)
+            has_correction = CORRECTION_PATTERN.search(content)
 
             if has_multiple:
                 files_with_multiple.append(filename)
@@ -422,39 +467,12 @@ class StatisticalValidator(BaseValidator):
         check_name = "Statistical Assumptions"
         category = "statistical"
 
-        # Assumption test patterns
-        assumption_patterns = [
-            # Normality tests
-            re.compile(r"shapiro|normaltest|kstest|anderson", re.IGNORECASE),
-            re.compile(r"qqplot|probplot", re.IGNORECASE),
-
-            # Homogeneity of variance
-            re.compile(r"levene|bartlett|fligner", re.IGNORECASE),
-
-            # Sphericity
-            re.compile(r"mauchly", re.IGNORECASE),
-
-            # Independence
-            re.compile(r"durbin.watson", re.IGNORECASE),
-
-            # General diagnostics
-            re.compile(r"diagnostic|residual.*plot", re.IGNORECASE),
-        ]
-
-        # Parametric tests that require assumptions
-        parametric_tests = [
-            re.compile(r"ttest_ind|ttest_rel", re.IGNORECASE),
-            re.compile(r"anova|f_oneway", re.IGNORECASE),
-            re.compile(r"pearsonr", re.IGNORECASE),
-            re.compile(r"linregress|OLS|regression", re.IGNORECASE),
-        ]
-
         files_with_parametric = []
         files_with_assumptions = []
 
         for filename, content in code_contents:
-            has_parametric = any(pattern.search(content) for pattern in parametric_tests)
-            has_assumptions = any(pattern.search(content) for pattern in assumption_patterns)
+            has_parametric = PARAMETRIC_TEST_PATTERN.search(content)
+            has_assumptions = ASSUMPTION_PATTERN.search(content)
 
             if has_parametric:
                 files_with_parametric.append(filename)
@@ -17,6 +17,9 @@ from workflow_context import (
     ResearchPhase,
     Mode,
     ValidationResult,
+    PHASE_ORDER,
+    PHASE_COUNT,
+    PHASE_TITLES,
     create_backup
 )
 
@@ -24,6 +27,26 @@ from workflow_context import (
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Forward transition event for each phase (linear progression)
+NEXT_TRANSITION = {
+    ResearchPhase.PROBLEM_FORMULATION: "start_literature_review",
+    ResearchPhase.LITERATURE_REVIEW: "start_gap_analysis",
+    ResearchPhase.GAP_ANALYSIS: "start_hypothesis_formation",
+    ResearchPhase.HYPOTHESIS_FORMATION: "start_experimental_design",
+    ResearchPhase.EXPERIMENTAL_DESIGN: "start_irb_approval",
+    ResearchPhase.IRB_APPROVAL: "start_data_collection",
+    ResearchPhase.DATA_COLLECTION: "start_analysis",
+    ResearchPhase.ANALYSIS: "start_interpretation",
+    ResearchPhase.INTERPRETATION: "start_writing",
+    ResearchPhase.WRITING: "start_publication",
+}
+
+# Same progression, going straight to data collection (no human subjects)
+NEXT_TRANSITION_SKIP_IRB = {
+    **NEXT_TRANSITION,
+    ResearchPhase.EXPERIMENTAL_DESIGN: "start_data_collection",
+}
+
 
 class ResearchWorkflow(StateMachine):
     """
@@ -85,6 +108,11 @@ class ResearchWorkflow(StateMachine):
         self.context = context or WorkflowContext()
         super().__init__()
 
+        # State attributes are named after their phase values
+        self._state_objects = {
+            phase: getattr(self, phase.value) for phase in PHASE_ORDER
+        }
+
         # Set initial state from context
         if context:
             self._set_state_from_context()
@@ -93,25 +121,11 @@ class ResearchWorkflow(StateMachine):
 
     def _set_state_from_context(self):
         """Set state machine to match context's current phase"""
-        phase_to_state = {
-            ResearchPhase.PROBLEM_FORMULATION: self.problem_formulation,
-            ResearchPhase.LITERATURE_REVIEW: self.literature_review,
-            ResearchPhase.GAP_ANALYSIS: self.gap_analysis,
-            ResearchPhase.HYPOTHESIS_FORMATION: self.hypothesis_formation,
-            ResearchPhase.EXPERIMENTAL_DESIGN: self.experimental_design,
-            ResearchPhase.IRB_APPROVAL: self.irb_approval,
-            ResearchPhase.DATA_COLLECTION: self.data_collection,
-            ResearchPhase.ANALYSIS: self.analysis,
-            ResearchPhase.INTERPRETATION: self.interpretation,
-            ResearchPhase.WRITING: self.writing,
-            ResearchPhase.PUBLICATION: self.publication,
-        }
-        target_state = phase_to_state[self.context.current_phase]
-        self.current_state = target_state
+        self.current_state = self._state_objects[self.context.current_phase]
 
     def get_phase_name(self) -> str:
         """Get human-readable name of current phase"""
-        return self.current_state.value.replace("_", " ").title()
+        return PHASE_TITLES[ResearchPhase(self.current_state.value)]
 
     def can_progress(self) -> bool:
         """Check if workflow can progress to next phase"""
@@ -124,11 +138,10 @@ class ResearchWorkflow(StateMachine):
 
     def get_next_phase(self) -> Optional[ResearchPhase]:
         """Get the next phase in linear progression"""
-        phases = list(ResearchPhase)
         current_index = self.context.get_current_phase_index()
 
-        if current_index < len(phases) - 1:
-            return phases[current_index + 1]
+        if current_index < PHASE_COUNT - 1:
+            return PHASE_ORDER[current_index + 1]
         return None
 
     def progress_to_next(self, skip_irb: bool = False) -> bool:
@@ -145,58 +158,17 @@ class ResearchWorkflow(StateMachine):
         create_backup(self.context)
 
         # Determine next transition
-        current = self.current_state
-
-        try:
-            if current == self.problem_formulation:
-                self.start_literature_review()
-                return True
-
-            elif current == self.literature_review:
-                self.start_gap_analysis()
-                return True
-
-            elif current == self.gap_analysis:
-                self.start_hypothesis_formation()
-                return True
-
-            elif current == self.hypothesis_formation:
-                self.start_experimental_design()
-                return True
-
-            elif current == self.experimental_design:
-                if skip_irb:
-                    self.start_data_collection()
-                else:
-                    self.start_irb_approval()
-                return True
-
-            elif current == self.irb_approval:
-                self.start_data_collection()
-                return True
-
-            elif current == self.data_collection:
-                self.start_analysis()
-                return True
-
-            elif current == self.analysis:
-                self.start_interpretation()
-                return True
-
-            elif current == self.interpretation:
-                self.start_writing()
-                return True
-
-            elif current == self.writing:
-                self.start_publication()
-                return True
-
-            elif current == self.publication:
-                logger.info("Already at final phase (Publication)")
-                return False
+        transitions = NEXT_TRANSITION_SKIP_IRB if skip_irb else NEXT_TRANSITION
+        event = transitions.get(ResearchPhase(self.current_state.value))
 
+        if event is None:
+            logger.info("Already at final phase (Publication)")
             return False
 
+        try:
+            self.send(event)
+            return True
+
         except TransitionNotAllowed as e:
             logger.error(f"Transition not allowed: {e}")
             return False
@@ -262,12 +234,8 @@ class ResearchWorkflow(StateMachine):
 
     def get_progress_percentage(self) -> float:
         """Calculate workflow completion percentage"""
-        total_phases = len(list(ResearchPhase))
-        completed = sum(
-            1 for phase in ResearchPhase
-            if self.context.has_completed_phase(phase)
-        )
-        return (completed / total_phases) * 100
+        completed = self.context.completed_phase_count()
+        return (completed / PHASE_COUNT) * 100
 
     def save_state(self, filepath: Optional[Path] = None):
         """Save current workflow state"""
@@ -287,11 +255,8 @@ class ResearchWorkflow(StateMachine):
             "mode": self.context.mode.value,
             "current_phase": self.get_phase_name(),
             "progress": f"{self.get_progress_percentage():.1f}%",
-            "completed_phases": sum(
-                1 for phase in ResearchPhase
-                if self.context.has_completed_phase(phase)
-            ),
-            "total_phases": len(list(ResearchPhase)),
+            "completed_phases": self.context.completed_phase_count(),
+            "total_phases": PHASE_COUNT,
             "can_progress": self.can_progress(),
             "allowed_transitions": self.get_allowed_transitions()
         }
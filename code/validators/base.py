@@ -5,6 +5,7 @@ Abstract base class for all phase validators.
 """
 
 from abc import ABC, abstractmethod
+import os
 from pathlib import Path
 from typing import Optional
 import sys
@@ -67,8 +68,7 @@ class BaseValidator(ABC):
 
     def _file_exists(self, filepath: str) -> bool:
         """Check if a file exists relative to project root"""
-        path = self.project_root / filepath
-        return path.exists() and path.is_file()
+        return (self.project_root / filepath).is_file()
 
     def _file_has_content(self, filepath: str, min_lines: int = 1) -> bool:
         """Check if file exists and has minimum content"""
@@ -85,8 +85,8 @@ class BaseValidator(ABC):
 
     def _count_files_in_dir(self, dirpath: str) -> int:
         """Count files in a directory"""
-        dir_path = self.project_root / dirpath
-        if not dir_path.exists() or not dir_path.is_dir():
+        try:
+            with os.scandir(self.project_root / dirpath) as entries:
+                return sum(1 for _ in entries)
+        except OSError:
             return 0
-
-        return len(list(dir_path.glob("*")))
@@ -5,7 +5,7 @@ Maintains state and context throughout the research workflow.
 Provides data passing between phases and agents.
 """
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
@@ -13,6 +13,14 @@ from typing import Dict, List, Optional, Any
 import json
 import uuid
 
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# State files with this suffix are stored as MessagePack (requires msgspec)
+MSGPACK_SUFFIX = ".msgpack"
+
 
 class Mode(str, Enum):
     """Research workflow operation mode"""
@@ -35,7 +43,15 @@ class ResearchPhase(str, Enum):
     PUBLICATION = "publication"
 
 
-@dataclass
+# Linear phase order, shared by navigation and progress calculations
+PHASE_ORDER = tuple(ResearchPhase)
+PHASE_COUNT = len(PHASE_ORDER)
+
+# Human-readable phase names, e.g. "Problem Formulation"
+PHASE_TITLES = {phase: phase.value.replace("_", " ").title() for phase in PHASE_ORDER}
+
+
+@dataclass(slots=True)
 class PhaseRecord:
     """Record of a completed phase"""
     phase: ResearchPhase
@@ -47,7 +63,7 @@ class PhaseRecord:
     notes: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of validation gate"""
     passed: bool
@@ -62,7 +78,7 @@ class ValidationResult:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowContext:
     """Complete workflow state and context"""
 
@@ -96,14 +112,14 @@ class WorkflowContext:
 
     def add_audit_entry(self, action: str, details: Dict[str, Any]):
         """Add entry to audit trail"""
-        entry = {
-            "timestamp": datetime.now().isoformat(),
+        timestamp = datetime.now().isoformat()
+        self.audit_trail.append({
+            "timestamp": timestamp,
             "action": action,
             "phase": self.current_phase.value,
             "details": details
-        }
-        self.audit_trail.append(entry)
-        self.update_timestamp()
+        })
+        self.updated_at = timestamp
 
     def start_phase(self, phase: ResearchPhase, agent: Optional[str] = None):
         """Record phase start"""
@@ -151,6 +167,12 @@ class WorkflowContext:
                 return record.outputs
         return []
 
+    def completed_phase_count(self) -> int:
+        """Get the number of distinct phases completed"""
+        return len({
+            record.phase for record in self.phase_history if record.exited_at
+        })
+
     def has_completed_phase(self, phase: ResearchPhase) -> bool:
         """Check if a phase has been completed"""
         for record in self.phase_history:
@@ -160,8 +182,7 @@ class WorkflowContext:
 
     def get_current_phase_index(self) -> int:
         """Get index of current phase in workflow"""
-        phases = list(ResearchPhase)
-        return phases.index(self.current_phase)
+        return PHASE_ORDER.index(self.current_phase)
 
     def to_dict(self) -> dict:
         """Convert context to dictionary for serialization"""
@@ -220,32 +241,47 @@ class WorkflowContext:
         return cls(**data)
 
     def save(self, filepath: Optional[Path] = None):
-        """Save context to JSON file"""
+        """Save context to JSON file (MessagePack for .msgpack paths)"""
         if filepath is None:
             filepath = self.project_root / ".research_workflow" / "state.json"
 
         filepath.parent.mkdir(parents=True, exist_ok=True)
 
+        if filepath.suffix == MSGPACK_SUFFIX:
+            filepath.write_bytes(_msgpack().encode(self.to_dict()))
+            return
+
         with open(filepath, 'w') as f:
             json.dump(self.to_dict(), f, indent=2)
 
     @classmethod
     def load(cls, filepath: Path) -> "WorkflowContext":
-        """Load context from JSON file"""
+        """Load context from JSON file (MessagePack for .msgpack paths)"""
+        if filepath.suffix == MSGPACK_SUFFIX:
+            return cls.from_dict(_msgpack().decode(filepath.read_bytes()))
+
         with open(filepath, 'r') as f:
             data = json.load(f)
         return cls.from_dict(data)
 
 
+def _msgpack():
+    """Return the msgspec MessagePack module, or raise if msgspec is missing"""
+    if msgspec is None:
+        raise ImportError(
+            f"msgspec is required for {MSGPACK_SUFFIX} workflow state files"
+        )
+    return msgspec.msgpack
+
+
 def create_backup(context: WorkflowContext, backup_dir: Optional[Path] = None):
     """Create timestamped backup of workflow state"""
     if backup_dir is None:
         backup_dir = context.project_root / ".research_workflow" / "backups"
 
-    backup_dir.mkdir(parents=True, exist_ok=True)
-
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     backup_file = backup_dir / f"state_{timestamp}.json"
 
+    # save() creates backup_dir if needed
     context.save(backup_file)
     return backup_file
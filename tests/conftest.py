@@ -0,0 +1,109 @@
+"""
+Shared pytest configuration for the test suite.
+
+The suite runs in parallel with pytest-xdist:
+
+    pytest tests/ -n auto
+"""
+
+import json
+import os
+import re
+import shutil
+import sys
+
+import pytest
+import responses
+
+# Make the code/ modules importable once per session
+CODE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "code"
+)
+if CODE_DIR not in sys.path:
+    sys.path.insert(0, CODE_DIR)
+
+CROSSREF_WORKS_URL = "https://api.crossref.org/works/"
+
+SAMPLE_BIB = """
+@article{smith2020,
+  author = {Smith, John},
+  title = {Test Article},
+  journal = {Test Journal},
+  year = {2020}
+}
+
+@inproceedings{jones2021,
+  author = {Jones, Jane},
+  title = {Conference Paper},
+  booktitle = {Test Conference},
+  year = {2021}
+}
+"""
+
+
+PROBLEM_STATEMENT_MD = "# Problem\n" * 20
+
+
+@pytest.fixture(scope="module")
+def sample_bib_dir(tmp_path_factory):
+    """Project directory containing references.bib, built once per module"""
+    project = tmp_path_factory.mktemp("bib")
+    (project / "references.bib").write_text(SAMPLE_BIB)
+    return project
+
+
+@pytest.fixture(scope="module")
+def sample_verifier(sample_bib_dir):
+    """CitationVerifier over sample_bib_dir for tests that do not mutate it"""
+    from quality_assurance.citation_verifier import CitationVerifier
+
+    return CitationVerifier(sample_bib_dir)
+
+
+@pytest.fixture
+def crossref_mock():
+    """
+    Intercept Crossref works lookups made through requests.
+
+    Register metadata with ``crossref_mock.works[doi] = {...}``; any other
+    DOI gets a 404. Force an error response with
+    ``crossref_mock.statuses[doi] = 503``. Recorded requests are in
+    ``crossref_mock.calls``.
+    """
+    works = {}
+    statuses = {}
+
+    def reply(request):
+        doi = request.url[len(CROSSREF_WORKS_URL):]
+        if doi in statuses:
+            return statuses[doi], {}, ""
+        if doi in works:
+            return 200, {}, json.dumps({"message": works[doi]})
+        return 404, {}, "Resource not found."
+
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as mock:
+        mock.add_callback(
+            responses.GET,
+            re.compile(re.escape(CROSSREF_WORKS_URL) + r".+"),
+            callback=reply
+        )
+        mock.works = works
+        mock.statuses = statuses
+        yield mock
+
+
+@pytest.fixture(scope="module")
+def project_skeleton(tmp_path_factory):
+    """Minimal research project layout, built once per module (do not mutate)"""
+    root = tmp_path_factory.mktemp("skeleton")
+    (root / "docs").mkdir()
+    (root / "docs" / "problem_statement.md").write_text(PROBLEM_STATEMENT_MD)
+    return root
+
+
+@pytest.fixture
+def project_root(project_skeleton, tmp_path):
+    """Per-test copy of project_skeleton that tests may modify"""
+    root = tmp_path / "project"
+    shutil.copytree(project_skeleton, root)
+    return root
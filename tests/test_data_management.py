@@ -5,10 +5,6 @@ Unit tests for Data Management System
 import pytest
 from pathlib import Path
 import tempfile
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
 
 from data_management.dvc_manager import DVCManager
 from data_management.mlflow_manager import MLflowManager, track_experiment
@@ -5,11 +5,6 @@ Tests actual code execution paths with real files and real validation logic.
 """
 
 import pytest
-from pathlib import Path
-import sys
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "code"))
 
 from research_workflow import (
     ResearchWorkflow, ResearchPhase, create_workflow
@@ -391,19 +386,15 @@ random.seed(42)
 class TestOrchestratorRealLogic:
     """Test orchestrator with real advancement logic"""
 
-    def test_advance_workflow_success_path(self, tmp_path):
+    def test_advance_workflow_success_path(self, project_root):
         """Test successful workflow advancement with real validation"""
+        # project_root already contains docs/problem_statement.md for FINER
         orchestrator = create_orchestrator(
             research_question="Does exercise reduce stress in college students?",
             mode=Mode.ASSISTANT,
-            project_root=tmp_path
+            project_root=project_root
         )
 
-        # Create required files for FINER validation
-        docs_dir = tmp_path / "docs"
-        docs_dir.mkdir()
-        (docs_dir / "problem_statement.md").write_text("# Problem\n" * 20)
-
         # Advance workflow
         result = orchestrator.advance_workflow(skip_irb=True)
 